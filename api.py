@@ -1,57 +1,165 @@
 # api.py
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
-from typing import List, Optional
-import fitz
-import json
-from resume_parser import parse_resume
+from fastapi import FastAPI, UploadFile, File
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Dict, List, Optional, Set
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+import asyncio
+import itertools
+import os
+import tempfile
+import orjson
+from pdf_text import extract_pdf_text
+from resume_parser import parse_resume, warm_up
 
-app = FastAPI(title="Resume Parser API (Demo)")
+# In-memory store keyed by upload id, in upload order (replace with DB in production).
+# Ids rather than filenames, so different candidates' same-named files are all kept.
+RESUMES: Dict[int, dict] = {}
+_RESUME_IDS = itertools.count()
+# inverted index for the /resumes skill filter: lower-cased skill -> upload ids
+SKILL_INDEX: Dict[str, Set[int]] = defaultdict(set)
 
-# In-memory store (replace with DB in production)
-RESUMES = []
+# PDF decoding and parsing are pure CPU work; run them off the event loop, one file per worker.
+# RESUME_PARSER_EXECUTOR=thread swaps the process pool for asyncio.to_thread: lighter on
+# memory, still keeps the loop free while MuPDF extracts text (it releases the GIL).
+EXECUTOR_KIND = os.getenv("RESUME_PARSER_EXECUTOR", "process")
+if EXECUTOR_KIND not in ("process", "thread"):
+    raise ValueError(f"RESUME_PARSER_EXECUTOR must be 'process' or 'thread', got {EXECUTOR_KIND!r}")
+# created by lifespan() in process mode, and replaced if a worker dies
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+def _new_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=warm_up)
+
+def _replace_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """Swap in a fresh pool once `pool` is broken, so one crashed worker doesn't fail every later upload."""
+    global EXECUTOR
+    if EXECUTOR is pool:
+        EXECUTOR = _new_executor()
+    pool.shutdown(wait=False)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global EXECUTOR
+    if EXECUTOR_KIND == "process":
+        EXECUTOR = _new_executor()
+    yield
+    if EXECUTOR is not None:
+        EXECUTOR.shutdown()
+        EXECUTOR = None
+
+app = FastAPI(title="Resume Parser API (Demo)", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# uploads are copied to disk in pieces of this size instead of being read whole
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+async def _spool_upload(file: UploadFile) -> str:
+    """Stream an upload into a temp file, UPLOAD_CHUNK_SIZE at a time, and return its path."""
+    suffix = os.path.splitext(file.filename)[1].lower()
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            tmp.write(chunk)
+    return tmp.name
+
+def _parse_file(filename: str, path: str) -> dict:
+    """Decode one spooled upload and parse it (runs in an EXECUTOR worker process, or a thread)."""
+    if filename.lower().endswith(".pdf"):
+        try:
+            text = extract_pdf_text(path)
+        except Exception as e:
+            raise ValueError(f"Failed to read PDF {filename}: {e}")
+    else:
+        with open(path, "rb") as fh:
+            content = fh.read()
+        try:
+            text = content.decode("utf-8", errors="ignore")
+        except:
+            text = str(content)
+    parsed = parse_resume(text)
+    parsed["filename"] = filename
+    return parsed
+
+def _skill_keys(parsed: dict) -> Set[str]:
+    return {s.lower() for vals in parsed.get("skills", {}).values() for s in vals}
+
+def _store_resume(parsed: dict) -> None:
+    """Add a parsed resume to RESUMES under a new upload id and index its skills."""
+    resume_id = next(_RESUME_IDS)
+    RESUMES[resume_id] = parsed
+    for s in _skill_keys(parsed):
+        SKILL_INDEX[s].add(resume_id)
+
+async def _run_parse(filename: str, path: str) -> dict:
+    """Run _parse_file on the configured executor, replacing the process pool if it breaks."""
+    if EXECUTOR_KIND == "thread":
+        return await asyncio.to_thread(_parse_file, filename, path)
+    loop = asyncio.get_running_loop()
+    pool = EXECUTOR
+    try:
+        future = loop.run_in_executor(pool, _parse_file, filename, path)
+    except BrokenProcessPool:
+        # broken by an earlier upload: this file is not at fault, so retry on a fresh pool
+        _replace_broken_pool(pool)
+        pool = EXECUTOR
+        future = loop.run_in_executor(pool, _parse_file, filename, path)
+    try:
+        return await future
+    except BrokenProcessPool:
+        # a worker died on this batch (e.g. killed for memory); report it and recover
+        _replace_broken_pool(pool)
+        raise
 
 @app.post("/upload_resume")
 async def upload_resume(files: List[UploadFile] = File(...)):
-    results = []
-    for file in files:
-        try:
-            content = await file.read()
+    filenames, paths, tasks = [], [], []
+    try:
+        for file in files:
             if not (file.filename.lower().endswith(".pdf") or file.filename.lower().endswith(".txt")):
                 # skip unknown types
                 continue
-            if file.filename.lower().endswith(".pdf"):
-                try:
-                    pdf = fitz.open(stream=content, filetype="pdf")
-                    text = "".join(page.get_text() for page in pdf)
-                except Exception as e:
-                    raise HTTPException(status_code=400, detail=f"Failed to read PDF {file.filename}: {e}")
-            else:
-                try:
-                    text = content.decode("utf-8", errors="ignore")
-                except:
-                    text = str(content)
-            parsed = parse_resume(text)
-            parsed["filename"] = file.filename
-            RESUMES.append(parsed)
-            results.append(parsed)
-        except Exception as exc:
+            path = await _spool_upload(file)
+            filenames.append(file.filename)
+            paths.append(path)
+            tasks.append(asyncio.create_task(_run_parse(file.filename, path)))
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        for path in paths:
+            os.unlink(path)
+
+    results = []
+    for filename, outcome in zip(filenames, outcomes):
+        if isinstance(outcome, BaseException):
             # partial failure: report error for this file
-            results.append({"filename": file.filename, "error": str(exc)})
-    return JSONResponse(content={"message": "Upload complete", "resumes": results})
+            results.append({"filename": filename, "error": str(outcome)})
+            continue
+        _store_resume(outcome)
+        results.append(outcome)
+    return {"message": "Upload complete", "resumes": results}
 
 @app.get("/resumes")
 async def get_resumes(skill: Optional[str] = None, degree: Optional[str] = None):
-    results = RESUMES
+    results = list(RESUMES.values())
     if skill:
-        results = [r for r in results if skill.lower() in " ".join(sum(r.get("skills", {}).values(), [])).lower()]
+        # exact (case-insensitive) skill match via the index; ids sort into upload order
+        results = [RESUMES[i] for i in sorted(SKILL_INDEX.get(skill.lower(), ()))]
     if degree:
         results = [r for r in results if any(degree.lower() in (e.get("degree","") or "").lower() for e in r.get("education", []))]
     return {"resumes": results}
 
+def _export_chunks(resumes: List[dict]):
+    # serialize one record at a time so a large export is never built as a single buffer
+    yield b'{"resumes":['
+    for i, r in enumerate(resumes):
+        if i:
+            yield b","
+        yield orjson.dumps(r)
+    yield b"]}"
+
 @app.get("/resumes/export")
 async def export_resumes():
-    return JSONResponse(content={"resumes": RESUMES})
+    return StreamingResponse(_export_chunks(list(RESUMES.values())), media_type="application/json")
 
 @app.get("/")
 async def root():
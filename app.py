@@ -1,12 +1,70 @@
 # app.py
 import streamlit as st
-import fitz  # PyMuPDF
 import pandas as pd
+import csv
 import datetime
-import json
+import io
+import itertools
+import orjson
+import re
+from pdf_text import extract_pdf_text
 from resume_parser import parse_resume
 
 
+CGPA_RENDER_RE = re.compile(r"cgpa[:\s]*([0-9.]+)", re.IGNORECASE)
+# date shapes produced by resume_parser that can be turned into a duration
+DATE_SHORT = re.compile(r"^\d{2}/\d{4}$")
+DATE_YEAR = re.compile(r"^\d{4}$")
+
+def _parse_date(s, default=None):
+    """Parse a MM/YYYY or YYYY date string; anything else (or an invalid month) returns `default`."""
+    if s and DATE_SHORT.match(s):
+        month, year = int(s[:2]), int(s[3:])
+    elif s and DATE_YEAR.match(s):
+        month, year = 1, int(s)
+    else:
+        return default
+    if not (1 <= month <= 12 and year >= datetime.MINYEAR):
+        return default
+    return datetime.datetime(year, month, 1)
+
+def _resume_csv(result: dict) -> str:
+    """Single-row CSV of a parsed resume; nested fields are JSON-encoded."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(result.keys()), lineterminator="\n")
+    writer.writeheader()
+    writer.writerow({k: v if isinstance(v, (str, int, float, type(None))) else orjson.dumps(v).decode() for k, v in result.items()})
+    return buf.getvalue()
+
+def _candidate_row(parsed: dict) -> dict:
+    """Candidate-table row for a parsed resume; built once per ingested upload and kept in session_state."""
+    pi = parsed.get("personal_info", {})
+    return {
+        "Name": pi.get("name"),
+        "Email": pi.get("email"),
+        "Phone": pi.get("phone"),
+        "Skills": ", ".join(s for vals in parsed.get("skills", {}).values() for s in vals),
+        "Education": " | ".join(
+            ", ".join(filter(None, [e.get("degree", ""), e.get("field", ""), e.get("extra", "")]))
+            for e in parsed.get("education", [])
+        )
+    }
+
+@st.cache_data(show_spinner=False)
+def _parse_upload(name: str, content: bytes, is_pdf: bool) -> dict:
+    """Decode and parse one upload; cached on its name and bytes, so the same file in another session skips fitz + parsing."""
+    if is_pdf:
+        text = extract_pdf_text(content)
+    else:
+        try:
+            text = content.decode("utf-8", errors="ignore")
+        except:
+            text = str(content)
+    parsed = parse_resume(text)
+    parsed["filename"] = name
+    return parsed
+
+
 st.set_page_config(page_title="📄 AI Resume Parser", layout="wide")
 st.title("📄 AI Resume Parser")
 st.caption("Upload resume(s) (PDF/TXT) to parse. Demo only — data is not stored externally.")
@@ -36,23 +94,23 @@ uploaded_files = st.file_uploader("📤 Upload Resume(s)", type=["pdf", "txt"],
 
 if "resumes" not in st.session_state:
     st.session_state["resumes"] = []
+    st.session_state["rows"] = []
+    # (name, hash of bytes) of uploads already parsed; the uploader re-sends them on every rerun
+    st.session_state["ingested"] = set()
 
 if uploaded_files:
     new_results = []
     for uploaded in uploaded_files:
+        content = uploaded.getvalue()
+        key = (uploaded.name, hash(content))
+        if key in st.session_state["ingested"]:
+            continue
         try:
-            content = uploaded.read()
-            if uploaded.type == "application/pdf" or uploaded.name.lower().endswith(".pdf"):
-                pdf = fitz.open(stream=content, filetype="pdf")
-                text = "".join(page.get_text() for page in pdf)
-            else:
-                try:
-                    text = content.decode("utf-8", errors="ignore")
-                except:
-                    text = str(content)
-            parsed = parse_resume(text)
-            parsed["filename"] = uploaded.name
+            is_pdf = uploaded.type == "application/pdf" or uploaded.name.lower().endswith(".pdf")
+            parsed = _parse_upload(uploaded.name, content, is_pdf)
             st.session_state["resumes"].append(parsed)
+            st.session_state["rows"].append(_candidate_row(parsed))
+            st.session_state["ingested"].add(key)
             new_results.append(parsed)
         except Exception as exc:
             st.error(f"Failed to parse {uploaded.name}: {exc}")
@@ -73,27 +131,23 @@ if resumes:
     skill_filter = colf1.multiselect("Filter by Skill", skills_list)
     degree_filter = colf2.multiselect("Filter by Degree", degrees_list)
 
-    filtered = resumes
+    # (parsed resume, precomputed table row) pairs
+    filtered = list(zip(resumes, st.session_state["rows"]))
     if skill_filter:
-        filtered = [r for r in filtered if any(sf in sum(r.get("skills", {}).values(), []) for sf in skill_filter)]
+        wanted = set(skill_filter)
+        filtered = [(r, row) for r, row in filtered if not wanted.isdisjoint(itertools.chain.from_iterable(r.get("skills", {}).values()))]
     if degree_filter:
-        filtered = [r for r in filtered if any(df in (e.get("degree","") or "") for e in r.get("education", []) for df in degree_filter)]
+        filtered = [(r, row) for r, row in filtered if any(df in (e.get("degree","") or "") for e in r.get("education", []) for df in degree_filter)]
 
     # DataFrame for list
-    df_list = pd.DataFrame([{
-        "Name": r.get("personal_info", {}).get("name"),
-        "Email": r.get("personal_info", {}).get("email"),
-        "Phone": r.get("personal_info", {}).get("phone"),
-        "Skills": ", ".join(sum(r.get("skills", {}).values(), [])),
-        "Education": " | ".join([", ".join(filter(None, [e.get("degree",""), e.get("field",""), e.get("extra","")])) for e in r.get("education", [])])
-    } for r in filtered])
+    df_list = pd.DataFrame.from_records([row for _, row in filtered], columns=["Name", "Email", "Phone", "Skills", "Education"])
 
     st.dataframe(df_list, use_container_width=True, height=300)
 
     # Download all parsed resumes
     cold1, cold2 = st.columns(2)
     if cold1.button("⬇️ Download All (JSON)"):
-        st.download_button("Download JSON", data=json.dumps(resumes, indent=2), file_name="all_resumes.json")
+        st.download_button("Download JSON", data=orjson.dumps(resumes, option=orjson.OPT_INDENT_2).decode(), file_name="all_resumes.json")
     cold2.write("")
 
 # Resume details (select one)
@@ -124,13 +178,12 @@ if resumes:
             institute = e.get("institution") or e.get("institute")
             start = e.get("start_date")
             end = e.get("end_date")
-            import re
-            cgpa = None
+            # extract_education fills `cgpa`; only dig it out of `extra` if missing
+            cgpa = e.get("cgpa")
             extra = e.get("extra")
-            if isinstance(extra, str) and "cgpa" in extra.lower():
-                match = re.search(r"cgpa[:\s]*([0-9.]+)", extra, re.IGNORECASE)
-                if match:
-                    cgpa = match.group(1)
+            if not cgpa and isinstance(extra, str) and "cgpa" in extra.lower():
+                match = CGPA_RENDER_RE.search(extra)
+                cgpa = match.group(1) if match else None
             # Print exactly like screenshot - bold degree + subsequent lines plain
             md = f"**{degree}**  \n"
             if field:
@@ -156,14 +209,8 @@ if resumes:
         for e in exp:
             start = e.get("start_date")
             end = e.get("end_date")
-            try:
-                start_date = datetime.datetime.strptime(start, "%m/%Y") if start and "/" in start else (datetime.datetime.strptime(start, "%Y") if start and len(start) == 4 else None)
-            except:
-                start_date = None
-            try:
-                end_date = datetime.datetime.strptime(end, "%m/%Y") if end and "/" in end else (datetime.datetime.strptime(end, "%Y") if end and len(end) == 4 else datetime.datetime.today())
-            except:
-                end_date = datetime.datetime.today()
+            start_date = _parse_date(start)
+            end_date = _parse_date(end, default=datetime.datetime.today())
 
             if start_date:
                 months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
@@ -196,7 +243,7 @@ if resumes:
     st.markdown("### 🛠 Skills")
     skills = result.get("skills", {})
     if skills:
-        all_skills = sum(skills.values(), [])
+        all_skills = list(itertools.chain.from_iterable(skills.values()))
         if all_skills:
             tags_html = "".join([f"<span class='tag'>{s}</span>" for s in all_skills])
             st.markdown(f"<div class='skill-row'>{tags_html}</div>", unsafe_allow_html=True)
@@ -219,8 +266,8 @@ if resumes:
     st.markdown("---")
     # Export single resume
     cexp1, cexp2 = st.columns(2)
-    cexp1.download_button("⬇️ Download JSON", data=json.dumps(result, indent=2), file_name=f"{selected}.json")
-    cexp2.download_button("⬇️ Download CSV", data=pd.DataFrame([result]).to_csv(index=False), file_name=f"{selected}.csv")
+    cexp1.download_button("⬇️ Download JSON", data=orjson.dumps(result, option=orjson.OPT_INDENT_2).decode(), file_name=f"{selected}.json")
+    cexp2.download_button("⬇️ Download CSV", data=_resume_csv(result), file_name=f"{selected}.csv")
 
 st.markdown("---")
 st.caption("⚠️ Privacy Disclaimer: Uploaded resumes are processed only for demo purposes. No data is stored or shared externally.")
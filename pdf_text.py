@@ -0,0 +1,13 @@
+# pdf_text.py
+import fitz  # PyMuPDF
+from typing import Union
+
+def extract_pdf_text(source: Union[str, bytes]) -> str:
+    """
+    Text of every page of a PDF, given as a file path or raw bytes.
+    Pages are extracted one at a time and the document is closed as soon as
+    we are done, so MuPDF's allocations are released promptly.
+    """
+    pdf = fitz.open(source) if isinstance(source, str) else fitz.open(stream=source, filetype="pdf")
+    with pdf:
+        return "".join(page.get_text() for page in pdf)
@@ -1,14 +1,27 @@
 # resume_parser.py
+import os
 import re
-import spacy
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 
-# Load spaCy NER once (disable heavy pipes for speed)
-nlp = spacy.load("en_core_web_sm", disable=["parser", "tagger"])
+try:
+    # optional: RE2's linear-time engine for the backtracking-free extractor patterns
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # optional: Aho-Corasick automaton to scan for all SKILL_KEYWORDS in one pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 EMAIL_RE = re.compile(r'[a-zA-Z0-9.+_-]+@[a-zA-Z0-9._-]+\.[a-zA-Z]{2,}')
 PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}')
 
+# a line made only of 2-4 capitalized words, e.g. "John Smith"
+NAME_RE = re.compile(r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})")
+
 # small canonical skills list to boost recall (extend as needed)
 SKILL_KEYWORDS = [
     "python","java","c++","c","sql","pandas","numpy","tensorflow","pytorch",
@@ -17,24 +30,208 @@ SKILL_KEYWORDS = [
     "git","aws","gcp","azure","sql"
 ]
 
-def _first_person_name(text: str):
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
+# RE2's \s, \d and \b are ASCII-only: patterns compiled by _compile_linear spell
+# out what `re` means by \s, and the ones that need \d or \b stay on `re`
+_WS_CHARS = "\t\n\x0b\x0c\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+_WS = "[" + _WS_CHARS + "]"
+# what a letter matches under re.I (Python also folds i, k and s onto these)
+_CASE_VARIANTS = {"i": "Ii\u0130\u0131", "k": "Kk\u212a", "s": "Ss\u017f"}
+
+def _ascii_ignorecase(pattern: str) -> str:
+    """Expand each letter of a class-free pattern into the set re.I would match."""
+    if "[" in pattern:
+        raise ValueError("_ascii_ignorecase does not handle character classes")
+    out, escaped = [], False
+    for c in pattern:
+        if escaped or not c.isascii() or not c.isalpha():
+            out.append(c)
+        else:
+            out.append("[" + _CASE_VARIANTS.get(c.lower(), c.upper() + c.lower()) + "]")
+        escaped = c == "\\" and not escaped
+    return "".join(out)
+
+def _compile_linear(pattern: str, ignorecase: bool = False):
+    r"""
+    Compile a pattern free of lookarounds/backreferences with RE2 when it is
+    installed, otherwise with `re`. The pattern must not use \s, \d, \w or \b,
+    and case-insensitivity is expanded into explicit letter classes, so both
+    engines compile the same flag-free pattern and match the same text.
+    """
+    if ignorecase:
+        pattern = _ascii_ignorecase(pattern)
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+# section headers and the terminator that ends each section: the next known
+# section header on a new line (or a newline at the end of the text).
+# _find_section searches the terminator forward from the header, so each
+# section costs one linear scan however long or malformed the resume is.
+EDU_HEADER_RE = re.compile(r"(Education|Academics|Qualification|Educational|Academic Background|Education History)", re.I)
+EDU_END_RE = re.compile(r"\n(?:Experience|Projects|Skills|Certifications|Achievements|Work Experience|$)", re.I)
+EXP_HEADER_RE = re.compile(r"(Experience|Work Experience|Employment|Professional Experience)", re.I)
+EXP_END_RE = re.compile(r"\n(?:Projects|Education|Skills|Certifications|$)", re.I)
+SKILLS_HEADER_RE = re.compile(r"(Skills|Technical Skills|Core Skills|Areas of Expertise|Skillset)", re.I)
+SKILLS_END_RE = re.compile(r"\n(?:Certifications|Projects|Experience|Education|$)", re.I)
+PROJECTS_HEADER_RE = re.compile(r"(Projects|Selected Projects|Academic Projects)", re.I)
+PROJECTS_END_RE = re.compile(r"\n(?:Skills|Certifications|Experience|Education|$)", re.I)
+CERTS_HEADER_RE = re.compile(r"(Certifications|Certification)", re.I)
+CERTS_END_RE = re.compile(r"\n(?:Projects|Skills|Experience|Education|$)", re.I)
+# lower-cased substrings, one of which every header alternative above contains
+EDU_HEADER_WORDS = ("education", "academics", "qualification", "academic background")
+EXP_HEADER_WORDS = ("experience", "employment")
+SKILLS_HEADER_WORDS = ("skills", "areas of expertise")
+PROJECTS_HEADER_WORDS = ("projects",)
+CERTS_HEADER_WORDS = ("certification",)
+
+# education
+DEGREE_RE = _compile_linear(r"(Bachelor|Master|B\.Tech|M\.Tech|MBA|Ph\.D|BSc|MSc|Diploma|BE|B\.E\.)", ignorecase=True)
+INSTITUTION_RE = _compile_linear(r"(University|College|Institute|School|Institute of Technology|IIT|NIT)", ignorecase=True)
+CGPA_RE = re.compile(r"\b(?:CGPA|GPA)\b[:\s-]*([0-9](?:\.\d+)?(?:/[0-9]+)?)", re.I)
+CGPA_SLASH_RE = re.compile(r"\b\d\.\d{1,2}\/\d{1,3}\b")
+CGPA_LOOSE_RE = re.compile(r"\b(?:CGPA|GPA)\b.*?(\d\.\d{1,2})", re.I)
+# dates: MM/YYYY, YYYY, MMM YYYY
+DATE_RE = re.compile(r"(\d{2}/\d{4}|\d{4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})", re.I)
+# split by common separators (dash, pipe, long dash) or multiple spaces
+SPLIT_SEP_RE = _compile_linear(_WS + r"*[-–—|]" + _WS + "*|" + _WS + "{2,}")
+
+# experience / projects
+PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+COMPANY_AT_RE = _compile_linear(r"(?:at|@)" + _WS + r"+([A-Z][A-Za-z&\." + _WS_CHARS + "-]{2,})")
+ROLE_SPLIT_RE = re.compile(r"\s*[-|]\s*")
+COMPANY_LINE_RE = re.compile(r"[A-Z][a-zA-Z&\.\s]{2,}")
+ALPHA_RE = re.compile(r"[A-Za-z]")
+LOCATION_RE = _compile_linear(r"(Hyderabad|Bengaluru|Bangalore|Mumbai|Delhi|Chennai|Pune|Remote|India|United States|USA)", ignorecase=True)
+BULLET_RE = re.compile(r"(?:•|-|\*|\d+\.)\s*([^\n]+)")
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[\.\?\!])\s+')
+TECH_RE = _compile_linear(r"(Python|Java|C\+\+|SQL|PyTorch|TensorFlow|React|Angular|HTML|CSS|JavaScript|Pandas|NumPy)", ignorecase=True)
+PROJECT_DATE_RE = re.compile(r"(\d{2}/\d{4}|\d{4})")
+
+# skills / certifications
+SKILL_SPLIT_RE = _compile_linear(r"[,;/•\-|]")
+SKILL_BULLET_RE = re.compile(r"•\s*([^•\n]+)|-\s*([^-\\n]+)|(?:\n)([A-Za-z0-9+\#\.\s\-\_]{2,})")
+SKILL_KEYWORDS_LOWER = [(kw, kw.lower()) for kw in dict.fromkeys(SKILL_KEYWORDS)]
+CERT_WORD_RE = re.compile(r"certification", re.I)
+
+def _build_skill_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in SKILL_KEYWORDS:
+        automaton.add_word(kw.lower(), kw)
+    automaton.make_automaton()
+    return automaton
+
+SKILL_AUTOMATON = _build_skill_automaton()
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+def _whole_word_at(text: str, start: int, end: int) -> bool:
+    # text[start:end] is not glued to a word character on either side
+    before_ok = start == 0 or not _is_word_char(text[start - 1])
+    after_ok = end == len(text) or not _is_word_char(text[end])
+    return before_ok and after_ok
+
+def _keyword_skills(text_low: str) -> List[str]:
+    """
+    SKILL_KEYWORDS occurring in `text_low` as whole words (e.g. "java" not inside
+    "javascript"), in order of first appearance in the resume.
+    """
+    first_at = {}  # title -> (start, length) of its first whole-word occurrence
+    if SKILL_AUTOMATON is not None:
+        for last, kw in SKILL_AUTOMATON.iter(text_low):
+            start = last - len(kw) + 1
+            if _whole_word_at(text_low, start, last + 1):
+                first_at.setdefault(kw.title(), (start, len(kw)))
+    else:
+        # plain substring search with a manual boundary check; no regex engine needed
+        for kw, low in SKILL_KEYWORDS_LOWER:
+            i = text_low.find(low)
+            while i != -1:
+                if _whole_word_at(text_low, i, i + len(low)):
+                    first_at[kw.title()] = (i, len(low))
+                    break
+                i = text_low.find(low, i + 1)
+    return sorted(first_at, key=first_at.get)
+
+def _spacy_enabled() -> bool:
+    # spaCy NER is opt-in: the heuristics below cover the common resume layouts
+    return os.getenv("RESUME_PARSER_USE_SPACY", "0") == "1"
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    # Load spaCy NER lazily, once (disable heavy pipes for speed)
+    import spacy
+    return spacy.load("en_core_web_sm", disable=["parser", "tagger"])
+
+def warm_up() -> None:
+    """Load optional models up front (e.g. in a worker-process initializer)."""
+    if _spacy_enabled():
+        _get_nlp()
+
+def _clean_lines(text: str) -> List[str]:
+    # non-empty, stripped lines; parse_resume computes these once and passes them down
+    return [l.strip() for l in text.splitlines() if l.strip()]
+
+# lines these hit are headers, schools, degrees, places or "Role at Company", not names
+NAME_REJECT_RES = (
+    EDU_HEADER_RE, EXP_HEADER_RE, SKILLS_HEADER_RE, PROJECTS_HEADER_RE, CERTS_HEADER_RE,
+    INSTITUTION_RE, DEGREE_RE, LOCATION_RE, COMPANY_AT_RE,
+)
+# job-title words that NAME_RE would otherwise accept ("Senior Data Scientist")
+TITLE_WORDS = {
+    "engineer", "developer", "scientist", "analyst", "manager", "intern", "consultant",
+    "designer", "architect", "lead", "senior", "junior", "programmer", "student",
+    "specialist", "administrator", "director", "officer", "resume", "curriculum", "vitae",
+}
+
+def _name_in_line(line: str) -> Optional[str]:
+    """The capitalized words of `line` before any job title, if the line is a plausible name."""
+    if "@" in line or any(c.isdigit() for c in line):
+        return None
+    if not NAME_RE.fullmatch(line) or any(r.search(line) for r in NAME_REJECT_RES):
+        return None
+    words = line.split()
+    for i, w in enumerate(words):
+        if w.lower() in TITLE_WORDS:
+            words = words[:i]
+            break
+    return " ".join(words) if len(words) >= 2 else None
+
+def _first_person_name(text: str, lines: Optional[List[str]] = None):
+    """
+    Best-effort candidate name. Without RESUME_PARSER_USE_SPACY=1 this is
+    heuristic only (short first line, then a conservative regex over the next
+    few lines) and less precise than spaCy NER; returns None rather than guess.
+    """
+    if lines is None:
+        lines = _clean_lines(text)
     if not lines:
         return None
     # heuristic: top line short and capitalized -> name
     first = lines[0]
     if len(first.split()) <= 4 and first[0].isupper():
         return first
-    # else fallback to spaCy PERSON
-    doc = nlp(" ".join(lines[:6]))
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            return ent.text
+    # optional spaCy PERSON fallback over the first few lines
+    if _spacy_enabled():
+        doc = _get_nlp()(" ".join(lines[:6]))
+        for ent in doc.ents:
+            if ent.label_ == "PERSON":
+                return ent.text
+    # regex fallback: a header line that is nothing but a capitalized name
+    for line in lines[:6]:
+        name = _name_in_line(line)
+        if name:
+            return name
     return None
 
-def extract_personal_info(text: str) -> Dict[str, Any]:
+def extract_personal_info(text: str, lines: Optional[List[str]] = None) -> Dict[str, Any]:
     try:
-        name = _first_person_name(text)
+        name = _first_person_name(text, lines)
         email_m = EMAIL_RE.search(text)
         phone_m = PHONE_RE.search(text)
         return {
@@ -45,11 +242,30 @@ def extract_personal_info(text: str) -> Dict[str, Any]:
     except Exception:
         return {"name": None, "email": None, "phone": None}
 
+def _find_section(header_re, end_re, header_words, text: str, text_low: str) -> Optional[str]:
+    """
+    Return the section block from the first header up to its terminator, or
+    None when there is no header or nothing terminates it. The regexes are
+    skipped entirely when none of the header words occur in the case-folded
+    `text_low`.
+    """
+    if not any(w in text_low for w in header_words):
+        return None
+    header = header_re.search(text)
+    if not header:
+        return None
+    end = end_re.search(text, header.end())
+    return text[header.start():end.start()] if end else None
+
+def _find_dates(s: str) -> List[str]:
+    # every DATE_RE alternative needs a digit, so skip the regex for digit-free text
+    return DATE_RE.findall(s) if any(c.isdigit() for c in s) else []
+
 def _normalize_date_tokens(tokens: List[str]) -> List[str]:
     # reduce dates to common forms for display (keep original when possible)
     return tokens
 
-def extract_education(text: str) -> List[Dict[str, Any]]:
+def extract_education(text: str, text_low: Optional[str] = None, lines: Optional[List[str]] = None) -> List[Dict[str, Any]]:
     """
     More tolerant education extraction:
     - Detect various section headers (Education, Academics, Educational, Qualification)
@@ -59,133 +275,118 @@ def extract_education(text: str) -> List[Dict[str, Any]]:
     - Try to extract CGPA/GPA into a dedicated field `cgpa`.
     """
     education = []
-    try:
-        pattern = re.compile(
-            r"(Education|Academics|Qualification|Educational|Academic Background|Education History).*?"
-            r"(?=(?:\n(?:Experience|Projects|Skills|Certifications|Achievements|Work Experience|$)))",
-            re.S | re.I
-        )
-        match = pattern.search(text)
-        block = match.group(0) if match else text
-
-        lines = [l.strip() for l in block.splitlines() if l.strip()]
-        for i, line in enumerate(lines):
-            if re.search(r"(Bachelor|Master|B\.Tech|M\.Tech|MBA|Ph\.D|BSc|MSc|Diploma|BE|B\.E\.)", line, re.I):
-                edu = {}
-                # split by common separators (dash, pipe, long dash) or multiple spaces
-                parts = re.split(r"\s*[-–—|]\s*|\s{2,}", line)
-                if parts:
-                    edu["degree"] = parts[0].strip()
-                if len(parts) > 1:
-                    edu["field"] = parts[1].strip()
-                if len(parts) > 2:
-                    edu["extra"] = parts[2].strip()  # e.g., CGPA or honors
-
-                # --- Attempt to extract CGPA/GPA into a dedicated field ---
-                cgpa_match = None
-                # 1) same line / parts with explicit CGPA/GPA
-                cgpa_match = re.search(
-                    r"\b(?:CGPA|GPA)\b[:\s-]*([0-9](?:\.\d+)?(?:/[0-9]+)?)",
-                    line, re.I
-                )
-                if not cgpa_match:
-                    for p in parts:
-                        m = re.search(r"\b(?:CGPA|GPA)\b[:\s-]*([0-9](?:\.\d+)?(?:/[0-9]+)?)", p, re.I)
-                        if m:
-                            cgpa_match = m
-                            break
-                # 2) lookahead lines
-                if not cgpa_match:
-                    for j in range(i+1, min(i+4, len(lines))):
-                        m = re.search(r"\b(?:CGPA|GPA)\b[:\s-]*([0-9](?:\.\d+)?(?:/[0-9]+)?)", lines[j], re.I)
-                        if m:
-                            cgpa_match = m
-                            break
-                # 3) fallback: patterns like '8.5/10'
-                if not cgpa_match:
-                    m2 = re.search(r"\b\d\.\d{1,2}\/\d{1,3}\b", line)
-                    if m2:
-                        edu["cgpa"] = m2.group(0)
-                    else:
-                        m3 = re.search(r"\b(?:CGPA|GPA)\b.*?(\d\.\d{1,2})", line, re.I)
-                        if m3:
-                            edu["cgpa"] = m3.group(1)
+    if text_low is None:
+        text_low = text.casefold()
+    if lines is None:
+        lines = _clean_lines(text)
+    block = _find_section(EDU_HEADER_RE, EDU_END_RE, EDU_HEADER_WORDS, text, text_low)
+    lines_all = lines
+    if block:
+        lines = _clean_lines(block)
+
+    # a line is revisited as lookahead for up to 3 degree lines; scan it for dates only once
+    line_dates = {}
+    def dates_in(s: str) -> List[str]:
+        if s not in line_dates:
+            line_dates[s] = _find_dates(s)
+        return line_dates[s]
+
+    for i, line in enumerate(lines):
+        if DEGREE_RE.search(line):
+            edu = {}
+            # split by common separators (dash, pipe, long dash) or multiple spaces
+            parts = SPLIT_SEP_RE.split(line)
+            if parts:
+                edu["degree"] = parts[0].strip()
+            if len(parts) > 1:
+                edu["field"] = parts[1].strip()
+            if len(parts) > 2:
+                edu["extra"] = parts[2].strip()  # e.g., CGPA or honors
+
+            # --- Attempt to extract CGPA/GPA into a dedicated field ---
+            cgpa_match = None
+            # 1) same line / parts with explicit CGPA/GPA
+            cgpa_match = CGPA_RE.search(line)
+            if not cgpa_match:
+                for p in parts:
+                    m = CGPA_RE.search(p)
+                    if m:
+                        cgpa_match = m
+                        break
+            # 2) lookahead lines
+            if not cgpa_match:
+                for j in range(i+1, min(i+4, len(lines))):
+                    m = CGPA_RE.search(lines[j])
+                    if m:
+                        cgpa_match = m
+                        break
+            # 3) fallback: patterns like '8.5/10'
+            if not cgpa_match:
+                m2 = CGPA_SLASH_RE.search(line)
+                if m2:
+                    edu["cgpa"] = m2.group(0)
                 else:
-                    edu["cgpa"] = cgpa_match.group(1)
-                    # remove cgpa text from extra if present
-                    if "extra" in edu and isinstance(edu["extra"], str):
-                        edu["extra"] = re.sub(
-                            r"\b(?:CGPA|GPA)\b[:\s-]*[0-9](?:\.\d+)?(?:/[0-9]+)?",
-                            "",
-                            edu["extra"],
-                            flags=re.I
-                        ).strip()
-
-                # dates on same line (MM/YYYY, YYYY, MMM YYYY)
-                dates = re.findall(
-                    r"(\d{2}/\d{4}|\d{4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
-                    line, re.I
-                )
-                if dates:
-                    if len(dates) >= 1:
+                    m3 = CGPA_LOOSE_RE.search(line)
+                    if m3:
+                        edu["cgpa"] = m3.group(1)
+            else:
+                edu["cgpa"] = cgpa_match.group(1)
+                # remove cgpa text from extra if present
+                if "extra" in edu and isinstance(edu["extra"], str):
+                    edu["extra"] = CGPA_RE.sub("", edu["extra"]).strip()
+
+            # dates on same line (MM/YYYY, YYYY, MMM YYYY)
+            dates = dates_in(line)
+            if dates:
+                if len(dates) >= 1:
+                    edu["start_date"] = dates[0]
+                if len(dates) >= 2:
+                    edu["end_date"] = dates[1]
+
+            # lookahead up to 3 lines for institute, more dates, or cgpa
+            for j in range(i+1, min(i+4, len(lines))):
+                nxt = lines[j]
+                if INSTITUTION_RE.search(nxt) and "institution" not in edu:
+                    edu["institution"] = nxt
+                more_dates = dates_in(nxt)
+                if more_dates and "start_date" not in edu:
+                    edu["start_date"] = more_dates[0]
+                if len(more_dates) > 1 and "end_date" not in edu:
+                    edu["end_date"] = more_dates[1]
+                if "cgpa" not in edu:
+                    m = CGPA_RE.search(nxt)
+                    if m:
+                        edu["cgpa"] = m.group(1)
+
+            # if the extracted fields are sparse, still include degree if present
+            if edu.get("degree") or edu.get("institution"):
+                education.append(edu)
+
+    # If none found by header scanning and education still empty, try a whole-text fallback:
+    if not education:
+        for i, line in enumerate(lines_all):
+            if DEGREE_RE.search(line):
+                edu = {"degree": line}
+                # try lookahead same as above
+                for j in range(i+1, min(i+4, len(lines_all))):
+                    nxt = lines_all[j]
+                    if INSTITUTION_RE.search(nxt):
+                        edu["institution"] = nxt
+                    dates = dates_in(nxt)
+                    if dates and "start_date" not in edu:
                         edu["start_date"] = dates[0]
-                    if len(dates) >= 2:
+                    if len(dates) > 1 and "end_date" not in edu:
                         edu["end_date"] = dates[1]
-
-                # lookahead up to 3 lines for institute, more dates, or cgpa
-                for j in range(i+1, min(i+4, len(lines))):
-                    nxt = lines[j]
-                    if re.search(r"(University|College|Institute|School|Institute of Technology|IIT|NIT)", nxt, re.I) and "institution" not in edu:
-                        edu["institution"] = nxt
-                    more_dates = re.findall(
-                        r"(\d{2}/\d{4}|\d{4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
-                        nxt, re.I
-                    )
-                    if more_dates and "start_date" not in edu:
-                        edu["start_date"] = more_dates[0]
-                    if len(more_dates) > 1 and "end_date" not in edu:
-                        edu["end_date"] = more_dates[1]
-                    if "cgpa" not in edu:
-                        m = re.search(r"\b(?:CGPA|GPA)\b[:\s-]*([0-9](?:\.\d+)?(?:/[0-9]+)?)", nxt, re.I)
-                        if m:
-                            edu["cgpa"] = m.group(1)
-
-                # if the extracted fields are sparse, still include degree if present
-                if edu.get("degree") or edu.get("institution"):
-                    education.append(edu)
-
-        # If none found by header scanning and education still empty, try a whole-text fallback:
-        if not education:
-            lines_all = [l.strip() for l in text.splitlines() if l.strip()]
-            for i, line in enumerate(lines_all):
-                if re.search(r"(Bachelor|Master|B\.Tech|M\.Tech|MBA|Ph\.D|BSc|MSc|Diploma|BE|B\.E\.)", line, re.I):
-                    edu = {"degree": line}
-                    # try lookahead same as above
-                    for j in range(i+1, min(i+4, len(lines_all))):
-                        nxt = lines_all[j]
-                        if re.search(r"(University|College|Institute|School|Institute of Technology|IIT|NIT)", nxt, re.I):
-                            edu["institution"] = nxt
-                        dates = re.findall(
-                            r"(\d{2}/\d{4}|\d{4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})",
-                            nxt, re.I
-                        )
-                        if dates and "start_date" not in edu:
-                            edu["start_date"] = dates[0]
-                        if len(dates) > 1 and "end_date" not in edu:
-                            edu["end_date"] = dates[1]
-                        # cgpa fallback
-                        m = re.search(r"\b(?:CGPA|GPA)\b[:\s-]*([0-9](?:\.\d+)?(?:/[0-9]+)?)", nxt, re.I)
-                        if m:
-                            edu["cgpa"] = m.group(1)
-                    education.append(edu)
-    except Exception:
-        # fail gracefully
-        return education
+                    # cgpa fallback
+                    m = CGPA_RE.search(nxt)
+                    if m:
+                        edu["cgpa"] = m.group(1)
+                education.append(edu)
 
     return education
 
 
-def extract_experience(text: str) -> List[Dict[str, Any]]:
+def extract_experience(text: str, text_low: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Extract experience blocks:
     - Find Experience/Work Experience section if present, else whole text fallback.
@@ -193,183 +394,170 @@ def extract_experience(text: str) -> List[Dict[str, Any]]:
     - Responsibilities are taken preferentially from bullet lines; fallback to short lines (not long paragraphs).
     """
     experiences = []
-    try:
-        pattern = re.compile(r"(Experience|Work Experience|Employment|Professional Experience).*?(?=(?:\n(?:Projects|Education|Skills|Certifications|$)))", re.S | re.I)
-        match = pattern.search(text)
-        block = match.group(0) if match else text
-
-        chunks = re.split(r"\n\s*\n", block)
-        for chunk in chunks:
-            lines = [l.strip("•- *\t") for l in chunk.splitlines() if l.strip()]
-            if not lines:
-                continue
-            role = lines[0]
-            company = None
-            # common patterns: "Role at Company", "Role - Company", or next line company with org name
-            m_at = re.search(r"(?:at|@)\s+([A-Z][A-Za-z&\.\s-]{2,})", chunk)
-            if m_at:
-                company = m_at.group(1).strip()
-            else:
-                # try split by dash or pipe
-                if "-" in role or "|" in role:
-                    parts = re.split(r"\s*[-|]\s*", role)
-                    if len(parts) > 1:
-                        company = parts[1].strip()
-                        role = parts[0].strip()
-
-            # look for company in next line if it's capitalized and short
-            if not company and len(lines) > 1 and re.search(r"[A-Z][a-zA-Z&\.\s]{2,}", lines[1]):
-                candidate = lines[1]
-                if len(candidate.split()) < 6 and re.search(r"[A-Za-z]", candidate):
-                    company = candidate
-
-            # dates: MM/YYYY, YYYY, MMM YYYY
-            dates = re.findall(r"(\d{2}/\d{4}|\d{4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})", chunk, re.I)
-            start, end = (dates[0] if dates else None), (dates[1] if len(dates) > 1 else None)
-
-            # location heuristics
-            loc_m = re.search(r"(Hyderabad|Bengaluru|Bangalore|Mumbai|Delhi|Chennai|Pune|Remote|India|United States|USA)", chunk, re.I)
-            location = loc_m.group(0) if loc_m else None
-
-            # Responsibilities extraction: prefer explicit bullets; fallback to short lines or first few sentences
-            resp_items = re.findall(r"(?:•|-|\*|\d+\.)\s*([^\n]+)", chunk)
-            responsibilities = []
-            if resp_items:
-                responsibilities = [r.strip() for r in resp_items if r.strip()]
-            else:
-                # fallback: take up to first 5 short lines after the role (avoid huge paragraphs)
-                for ln in lines[1:6]:
-                    if ln and len(ln) < 200:
-                        responsibilities.append(ln)
-                # final fallback: split long paragraph into sentences and take first 3
-                if not responsibilities and len(lines) > 1:
-                    para = " ".join(lines[1:])
-                    sents = re.split(r'(?<=[\.\?\!])\s+', para)
-                    responsibilities = [s.strip() for s in sents[:3] if s.strip()]
-
-            experiences.append({
-                "role": role,
-                "company": company,
-                "start_date": start,
-                "end_date": end,
-                "location": location,
-                "responsibilities": responsibilities
-            })
-    except Exception:
-        return experiences
+    if text_low is None:
+        text_low = text.casefold()
+    block = _find_section(EXP_HEADER_RE, EXP_END_RE, EXP_HEADER_WORDS, text, text_low) or text
+
+    chunks = PARAGRAPH_SPLIT_RE.split(block)
+    for chunk in chunks:
+        lines = [l.strip("•- *\t") for l in chunk.splitlines() if l.strip()]
+        if not lines:
+            continue
+        role = lines[0]
+        company = None
+        # common patterns: "Role at Company", "Role - Company", or next line company with org name
+        m_at = COMPANY_AT_RE.search(chunk)
+        if m_at:
+            company = m_at.group(1).strip()
+        else:
+            # try split by dash or pipe
+            if "-" in role or "|" in role:
+                parts = ROLE_SPLIT_RE.split(role)
+                if len(parts) > 1:
+                    company = parts[1].strip()
+                    role = parts[0].strip()
+
+        # look for company in next line if it's capitalized and short
+        if not company and len(lines) > 1 and COMPANY_LINE_RE.search(lines[1]):
+            candidate = lines[1]
+            if len(candidate.split()) < 6 and ALPHA_RE.search(candidate):
+                company = candidate
+
+        # dates: MM/YYYY, YYYY, MMM YYYY
+        dates = _find_dates(chunk)
+        start, end = (dates[0] if dates else None), (dates[1] if len(dates) > 1 else None)
+
+        # location heuristics
+        loc_m = LOCATION_RE.search(chunk)
+        location = loc_m.group(0) if loc_m else None
+
+        # Responsibilities extraction: prefer explicit bullets; fallback to short lines or first few sentences
+        resp_items = BULLET_RE.findall(chunk)
+        responsibilities = []
+        if resp_items:
+            responsibilities = [r.strip() for r in resp_items if r.strip()]
+        else:
+            # fallback: take up to first 5 short lines after the role (avoid huge paragraphs)
+            for ln in lines[1:6]:
+                if ln and len(ln) < 200:
+                    responsibilities.append(ln)
+            # final fallback: split long paragraph into sentences and take first 3
+            if not responsibilities and len(lines) > 1:
+                para = " ".join(lines[1:])
+                sents = SENTENCE_SPLIT_RE.split(para)
+                responsibilities = [s.strip() for s in sents[:3] if s.strip()]
+
+        experiences.append({
+            "role": role,
+            "company": company,
+            "start_date": start,
+            "end_date": end,
+            "location": location,
+            "responsibilities": responsibilities
+        })
 
     return experiences
 
 
-def extract_skills(text: str) -> Dict[str, List[str]]:
+def extract_skills(text: str, text_low: Optional[str] = None, lines: Optional[List[str]] = None) -> Dict[str, List[str]]:
     """
     Extract skills from a Skills section (if any) or fallback to keyword scanning.
     Returns a dict of categories -> list[str].
     """
     skills = {}
-    try:
-        pattern = re.compile(r"(Skills|Technical Skills|Core Skills|Areas of Expertise|Skillset).*?(?=(?:\n(?:Certifications|Projects|Experience|Education|$)))", re.S | re.I)
-        match = pattern.search(text)
-        block = match.group(0) if match else text
-
-        # 1) category: values lines (Programming: Python, Java)
-        for line in block.splitlines():
-            if ":" in line and len(line) < 250:
-                cat, vals = line.split(":", 1)
-                if re.search(r"[A-Za-z]", cat):
-                    items = [s.strip() for s in re.split(r"[,;/•\-|]", vals) if s.strip()]
-                    if items:
-                        skills[cat.strip()] = sorted(list(dict.fromkeys([i.title() for i in items])))
-
-        # 2) bullet lists under skills heading
-        if not skills and match:
-            # try bullets (• -) or comma-separated
-            items = re.findall(r"•\s*([^•\n]+)|-\s*([^-\\n]+)|(?:\n)([A-Za-z0-9+\#\.\s\-\_]{2,})", block)
-            found = []
-            for tup in items:
-                for val in tup:
-                    if val and len(val.strip()) > 1:
-                        for part in re.split(r"[,;/•\-|]", val):
-                            p = part.strip()
-                            if p:
-                                found.append(p)
-            if found:
-                skills["General"] = sorted(list(dict.fromkeys([s.title() for s in found if len(s) < 40])))
-
-        # 3) fallback: keyword scan across whole text
-        if not skills:
-            found = set()
-            text_low = text.lower()
-            for kw in SKILL_KEYWORDS:
-                if re.search(r"\b" + re.escape(kw) + r"\b", text_low, re.I):
-                    found.add(kw.title())
-            if found:
-                skills["General"] = sorted(found)
-
-    except Exception:
-        return skills
+    if text_low is None:
+        text_low = text.casefold()
+    section = _find_section(SKILLS_HEADER_RE, SKILLS_END_RE, SKILLS_HEADER_WORDS, text, text_low)
+    block = section or text
+    if section:
+        block_lines = block.splitlines()
+    else:
+        block_lines = lines if lines is not None else _clean_lines(text)
+
+    # 1) category: values lines (Programming: Python, Java)
+    for line in block_lines:
+        if ":" in line and len(line) < 250:
+            cat, vals = line.split(":", 1)
+            if ALPHA_RE.search(cat):
+                # split, normalize and dedup in one pass, keeping the resume's order
+                seen = {}
+                for item in SKILL_SPLIT_RE.split(vals):
+                    item = item.strip()
+                    if item:
+                        seen.setdefault(item.title(), None)
+                if seen:
+                    skills[cat.strip()] = list(seen)
+
+    # 2) bullet lists under skills heading
+    if not skills and section:
+        # try bullets (• -) or comma-separated
+        items = SKILL_BULLET_RE.findall(block)
+        found = []
+        for tup in items:
+            for val in tup:
+                if val and len(val.strip()) > 1:
+                    for part in SKILL_SPLIT_RE.split(val):
+                        p = part.strip()
+                        if p:
+                            found.append(p)
+        if found:
+            skills["General"] = list(dict.fromkeys(s.title() for s in found if len(s) < 40))
+
+    # 3) fallback: keyword scan across whole text
+    if not skills:
+        found = _keyword_skills(text_low)
+        if found:
+            skills["General"] = found
 
     return skills
 
 
 
-def extract_projects(text: str) -> List[Dict[str, Any]]:
+def extract_projects(text: str, text_low: Optional[str] = None) -> List[Dict[str, Any]]:
     projects = []
-    try:
-        pattern = re.compile(r"(Projects|Selected Projects|Academic Projects).*?(?=(?:\n(?:Skills|Certifications|Experience|Education|$)))", re.S | re.I)
-        match = pattern.search(text)
-        block = match.group(0) if match else text
-        chunks = re.split(r"\n\s*\n", block)
-        for chunk in chunks:
-            lines = [l.strip("∗-• ") for l in chunk.splitlines() if l.strip()]
-            if not lines:
-                continue
-            title = lines[0]
-            tech = re.findall(r"(Python|Java|C\+\+|SQL|PyTorch|TensorFlow|React|Angular|HTML|CSS|JavaScript|Pandas|NumPy)", chunk, re.I)
-            date_m = re.search(r"(\d{2}/\d{4}|\d{4})", chunk)
-            projects.append({
-                "title": title,
-                "tech": list(dict.fromkeys([t.title() for t in tech])),
-                "date": date_m.group(0) if date_m else None,
-                "description": " ".join(lines[1:])
-            })
-    except Exception:
-        return projects
+    if text_low is None:
+        text_low = text.casefold()
+    block = _find_section(PROJECTS_HEADER_RE, PROJECTS_END_RE, PROJECTS_HEADER_WORDS, text, text_low) or text
+    chunks = PARAGRAPH_SPLIT_RE.split(block)
+    for chunk in chunks:
+        lines = [l.strip("∗-• ") for l in chunk.splitlines() if l.strip()]
+        if not lines:
+            continue
+        title = lines[0]
+        tech = TECH_RE.findall(chunk)
+        date_m = PROJECT_DATE_RE.search(chunk)
+        projects.append({
+            "title": title,
+            "tech": list(dict.fromkeys(t.title() for t in tech)),
+            "date": date_m.group(0) if date_m else None,
+            "description": " ".join(lines[1:])
+        })
     return projects
 
-def extract_certifications(text: str) -> List[str]:
+def extract_certifications(text: str, text_low: Optional[str] = None) -> List[str]:
     certs = []
-    try:
-        pattern = re.compile(r"(Certifications|Certification).*?(?=(?:\n(?:Projects|Skills|Experience|Education|$)))", re.S | re.I)
-        match = pattern.search(text)
-        block = match.group(0) if match else ""
-        for line in block.splitlines():
-            line = line.strip("∗-• ")
-            if line and not re.search(r"certification", line, re.I):
-                certs.append(line)
-    except Exception:
-        return certs
+    if text_low is None:
+        text_low = text.casefold()
+    block = _find_section(CERTS_HEADER_RE, CERTS_END_RE, CERTS_HEADER_WORDS, text, text_low) or ""
+    for line in block.splitlines():
+        line = line.strip("∗-• ")
+        if line and not CERT_WORD_RE.search(line):
+            certs.append(line)
     return certs
 
 def parse_resume(text: str) -> Dict[str, Any]:
     """
-    Top-level parser. Each extractor is tolerant and returns [] or {} on failure.
+    Top-level parser. Extractors return [] or {} when a section is not found.
     """
-    try:
-        return {
-            "personal_info": extract_personal_info(text),
-            "education": extract_education(text),
-            "experience": extract_experience(text),
-            "projects": extract_projects(text),
-            "skills": extract_skills(text),
-            "certifications": extract_certifications(text)
-        }
-    except Exception:
-        return {
-            "personal_info": {},
-            "education": [],
-            "experience": [],
-            "projects": [],
-            "skills": {},
-            "certifications": []
-        }
+    # case-folded text and stripped lines are computed once and shared by the extractors
+    text_low = text.casefold()
+    lines = _clean_lines(text)
+    parsed = {
+        "personal_info": extract_personal_info(text, lines),
+        "education": extract_education(text, text_low, lines),
+        "experience": extract_experience(text, text_low),
+        "projects": extract_projects(text, text_low),
+        "skills": extract_skills(text, text_low, lines),
+        "certifications": extract_certifications(text, text_low)
+    }
+    return parsed